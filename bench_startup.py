@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Startup-to-result latency benchmark for per-claim FNOL invocations
+Compares the per-claim entry point (src/fnol_processor.py) as it was before
+the warm server, the same entry point now, and a cold in-process client run
+against the client talking to a warm server
+
+Usage: bench_startup.py [runs] [baseline_rev]
+
+baseline_rev defaults to the commit before src/fnol_client.py was added.
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+sys.path.insert(0, SRC_DIR)
+
+from fnol_client import SERVER_UNAVAILABLE, send_document
+
+PROCESSOR = os.path.join(SRC_DIR, 'fnol_processor.py')
+CLIENT = os.path.join(SRC_DIR, 'fnol_client.py')
+SERVER = os.path.join(SRC_DIR, 'fnol_server.py')
+DOCUMENT = os.path.join(ROOT_DIR, 'fnol_documents', 'FNOL_001.txt')
+
+
+def default_baseline_rev():
+    """Return the commit before the one that added src/fnol_client.py"""
+    added = subprocess.run(
+        ['git', 'log', '--diff-filter=A', '--format=%H', '--', 'src/fnol_client.py'],
+        cwd=ROOT_DIR, check=True, capture_output=True, text=True
+    ).stdout.split()
+    return subprocess.run(
+        ['git', 'rev-parse', '--short', added[-1] + '^'],
+        cwd=ROOT_DIR, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def export_baseline_processor(rev, dest_dir):
+    """Write src/fnol_processor.py as of rev into dest_dir and return its path"""
+    source = subprocess.run(
+        ['git', 'show', f"{rev}:src/fnol_processor.py"],
+        cwd=ROOT_DIR, check=True, capture_output=True
+    ).stdout
+    path = os.path.join(dest_dir, 'fnol_processor.py')
+    with open(path, 'wb') as f:
+        f.write(source)
+    return path
+
+
+def time_command(args, env, runs):
+    """Return wall-clock latencies (ms) of running args to completion"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, env=env, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def wait_for_server(socket_path, timeout=10.0):
+    """Block until the server at socket_path answers a request"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            send_document(b'', socket_path)
+            return
+        except SERVER_UNAVAILABLE:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Server on {socket_path} did not start within {timeout:g}s")
+            time.sleep(0.01)
+
+
+def report(label, timings):
+    print(f"  {label:<32} median {statistics.median(timings):7.1f} ms   "
+          f"min {min(timings):7.1f} ms")
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    baseline_rev = sys.argv[2] if len(sys.argv) > 2 else default_baseline_rev()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, 'fnol.sock')
+        env = dict(os.environ, FNOL_SOCKET=socket_path)
+
+        # fnol_processor.py takes a directory, so give it one holding the document
+        input_dir = os.path.join(tmp, 'input')
+        output_dir = os.path.join(tmp, 'output')
+        os.mkdir(input_dir)
+        os.mkdir(output_dir)
+        shutil.copy(DOCUMENT, input_dir)
+
+        baseline_dir = os.path.join(tmp, 'baseline')
+        os.mkdir(baseline_dir)
+        baseline_processor = export_baseline_processor(baseline_rev, baseline_dir)
+
+        print(f"Startup-to-result latency over {runs} runs ({os.path.basename(DOCUMENT)})")
+        report(f"fnol_processor.py @ {baseline_rev}", time_command(
+            [sys.executable, baseline_processor, input_dir, output_dir], env, runs
+        ))
+        report("fnol_processor.py", time_command(
+            [sys.executable, PROCESSOR, input_dir, output_dir], env, runs
+        ))
+        report("cold (--local)", time_command(
+            [sys.executable, CLIENT, '--local', DOCUMENT], env, runs
+        ))
+
+        server = subprocess.Popen([sys.executable, SERVER, socket_path])
+        try:
+            wait_for_server(socket_path)
+            report("warm server", time_command(
+                [sys.executable, CLIENT, DOCUMENT], env, runs
+            ))
+        finally:
+            server.terminate()
+            server.wait()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+FNOL Claims Processing Client
+Sends a single FNOL document to a resident FNOL server and prints the result.
+
+The client deliberately imports nothing beyond os, sys, socket, stat and
+struct so that a per-claim invocation pays only interpreter start-up; the
+processor, its regex patterns and the JSON encoder stay warm in the server
+process (see fnol_server.py), which is started automatically on first use.
+
+The socket lives in a directory that must be owned by the current user with
+mode 0700, and the client checks that the listening process runs as the same
+user before sending a document, since documents contain personal data.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import stat
+import struct
+import sys
+
+# Name of the socket inside the default per-user directory
+SOCKET_NAME = 'fnol.sock'
+
+# Seconds to wait for an automatically started server to accept connections.
+# Longer than fnol_server.LOCK_TIMEOUT, which a new server may spend waiting
+# for a previous one to finish shutting down
+SERVER_START_TIMEOUT = 15.0
+
+# Seconds to wait on any single socket operation before giving up on the server
+REQUEST_TIMEOUT = 30.0
+
+# Errors meaning no server is listening, or it went away mid-request
+# (for example while shutting down after the idle timeout)
+SERVER_UNAVAILABLE = (
+    FileNotFoundError, ConnectionRefusedError, ConnectionResetError, BrokenPipeError
+)
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fnol_server.py')
+
+
+class FNOLServerError(Exception):
+    """Raised when the server fails to process a document"""
+
+
+def get_socket_path() -> str:
+    """
+    Return the server socket path, honouring the FNOL_SOCKET variable
+
+    The default is fnol_processor/fnol.sock under $XDG_RUNTIME_DIR, or
+    fnol_processor-<uid>/fnol.sock under $TMPDIR (/tmp) when it is unset.
+    """
+    if os.environ.get('FNOL_SOCKET'):
+        return os.path.abspath(os.environ['FNOL_SOCKET'])
+
+    if os.environ.get('XDG_RUNTIME_DIR'):
+        socket_dir = os.path.join(os.environ['XDG_RUNTIME_DIR'], 'fnol_processor')
+    else:
+        socket_dir = os.path.join(
+            os.environ.get('TMPDIR', '/tmp'), f"fnol_processor-{os.getuid()}"
+        )
+    return os.path.join(socket_dir, SOCKET_NAME)
+
+
+def ensure_private_dir(path: str) -> None:
+    """
+    Create path with mode 0700 if needed and check that only we can use it
+
+    Args:
+        path: Directory that holds the server socket and lock file
+
+    Raises:
+        PermissionError: If path is not a directory owned by the current
+            user, or is accessible to group or others
+    """
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+
+    st = os.lstat(path)
+    if (not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid()
+            or st.st_mode & 0o077):
+        raise PermissionError(
+            f"Socket directory {path} must be a directory owned by the "
+            "current user with mode 0700"
+        )
+
+
+def get_peer_uid(sock: socket.socket) -> int | None:
+    """
+    Return the uid of the process at the other end of a Unix socket
+
+    Args:
+        sock: Connected Unix domain socket
+
+    Returns:
+        Peer uid, or None where SO_PEERCRED is not supported
+    """
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    _, uid, _ = struct.unpack('3i', creds)
+    return uid
+
+
+def send_document(content: bytes, socket_path: str) -> str:
+    """
+    Send one document to the server and wait for its result
+
+    Args:
+        content: Raw UTF-8 document text
+        socket_path: Path of the server's Unix domain socket
+
+    Returns:
+        JSON-encoded processing result
+
+    Raises:
+        OSError: If the server cannot be reached or does not respond
+            (one of SERVER_UNAVAILABLE if there is no server to answer)
+        PermissionError: If the server is not running as the current user
+        FNOLServerError: If the server could not process the document
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(REQUEST_TIMEOUT)
+        sock.connect(socket_path)
+
+        peer_uid = get_peer_uid(sock)
+        if peer_uid is not None and peer_uid != os.getuid():
+            raise PermissionError(
+                f"Server on {socket_path} is running as uid {peer_uid}, "
+                f"not {os.getuid()}"
+            )
+
+        sock.sendall(content)
+        sock.shutdown(socket.SHUT_WR)
+
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    response = b''.join(chunks)
+    if not response:
+        # Connection was queued on a listener that closed before accepting it
+        raise ConnectionResetError(f"No response from server on {socket_path}")
+
+    status, _, body = response.partition(b'\n')
+    if status != b'OK':
+        raise FNOLServerError(body.decode('utf-8', 'replace'))
+    return body.decode('utf-8')
+
+
+def start_server(socket_path: str):
+    """
+    Launch a detached FNOL server listening on socket_path
+
+    The server's stderr is appended to fnol_server.log next to the socket.
+
+    Args:
+        socket_path: Path of the Unix domain socket to serve on
+
+    Returns:
+        subprocess.Popen for the server process
+    """
+    import subprocess
+
+    log_path = os.path.join(os.path.dirname(socket_path), 'fnol_server.log')
+    log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    try:
+        return subprocess.Popen(
+            [sys.executable, SERVER_SCRIPT, socket_path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=log_fd,
+            start_new_session=True
+        )
+    finally:
+        os.close(log_fd)
+
+
+def process_claim(file_path: str, socket_path: str = None, autostart: bool = True) -> str:
+    """
+    Process a single FNOL document through the resident server
+
+    Args:
+        file_path: Path to the FNOL document
+        socket_path: Server socket path (defaults to get_socket_path())
+        autostart: Start the server if it is not already running
+
+    Returns:
+        JSON-encoded processing result
+
+    Raises:
+        TimeoutError: If no server answered within SERVER_START_TIMEOUT
+    """
+    import time
+
+    socket_path = socket_path or get_socket_path()
+    ensure_private_dir(os.path.dirname(socket_path))
+
+    with open(file_path, 'rb') as f:
+        content = f.read()
+
+    deadline = None
+    server = None
+    while True:
+        try:
+            return send_document(content, socket_path)
+        except SERVER_UNAVAILABLE:
+            if not autostart:
+                raise
+
+        if deadline is None:
+            deadline = time.monotonic() + SERVER_START_TIMEOUT
+        elif time.monotonic() > deadline:
+            raise TimeoutError(
+                f"No FNOL server answered on {socket_path} within "
+                f"{SERVER_START_TIMEOUT:g}s (see fnol_server.log in that directory)"
+            )
+
+        # Start one server only. It waits for a previous server to finish
+        # shutting down, and exits if another server is already answering,
+        # in which case polling picks that one up
+        if server is None:
+            server = start_server(socket_path)
+        time.sleep(0.01)
+
+
+def process_claim_locally(file_path: str) -> str:
+    """
+    Process a single FNOL document in this process, without a server
+
+    Args:
+        file_path: Path to the FNOL document
+
+    Returns:
+        JSON-encoded processing result
+    """
+    import json
+
+    from fnol_processor import FNOLProcessor
+
+    return json.dumps(FNOLProcessor().process_document(file_path), indent=2)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    local = '--local' in args or not hasattr(socket, 'AF_UNIX')
+    args = [a for a in args if a != '--local']
+
+    if len(args) != 1:
+        print("Usage: fnol_client.py [--local] <fnol_document>", file=sys.stderr)
+        sys.exit(2)
+
+    try:
+        if local:
+            output = process_claim_locally(args[0])
+        else:
+            output = process_claim(args[0])
+    except FNOLServerError as exc:
+        # The server's message already names the exception type
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    except (OSError, ValueError) as exc:
+        # ValueError covers undecodable documents processed with --local
+        print(f"Error: {type(exc).__name__}: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    print(output)
@@ -3,9 +3,12 @@ FNOL (First Notice of Loss) Claims Processing Agent
 Extracts key fields, validates data, and routes claims based on rules.
 """
 
-import json
+# Imports are kept to the minimum needed to define the processor so that
+# per-claim invocations start quickly; json and os are imported where used,
+# and annotations are not evaluated at runtime so typing is never loaded.
+from __future__ import annotations
+
 import re
-from typing import Dict, List, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -29,13 +32,13 @@ class ExtractedFields:
     incident_location: str = None
     incident_description: str = None
     claimant_name: str = None
-    third_parties: List[str] = None
+    third_parties: list[str] = None
     claimant_contact: str = None
     asset_type: str = None
     asset_id: str = None
     estimated_damage: float = None
     claim_type: str = None
-    attachments: List[str] = None
+    attachments: list[str] = None
     police_report: str = None
     injuries: str = None
 
@@ -70,7 +73,7 @@ class FNOLProcessor:
         """Initialize the processor"""
         pass
 
-    def process_document(self, file_path: str) -> Dict:
+    def process_document(self, file_path: str) -> dict:
         """
         Process a single FNOL document
         
@@ -81,9 +84,37 @@ class FNOLProcessor:
             Dictionary with extracted fields, missing fields, routing decision, and reasoning
         """
         # Read document
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        return self.process_bytes(data)
+
+    def process_bytes(self, data: bytes) -> dict:
+        """
+        Process the raw bytes of a single FNOL document
+
+        Decodes as UTF-8 with universal newlines, exactly as reading the
+        file in text mode would, so every entry point sees the same text.
+
+        Args:
+            data: Raw UTF-8 document bytes
+
+        Returns:
+            Dictionary with extracted fields, missing fields, routing decision, and reasoning
+        """
+        content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        return self.process_text(content)
 
+    def process_text(self, content: str) -> dict:
+        """
+        Process the text of a single FNOL document
+
+        Args:
+            content: Full text of the FNOL document
+
+        Returns:
+            Dictionary with extracted fields, missing fields, routing decision, and reasoning
+        """
         # Extract fields
         extracted = self._extract_fields(content)
 
@@ -221,7 +252,7 @@ class FNOLProcessor:
                 return value
         return None
 
-    def _identify_missing_fields(self, extracted: ExtractedFields) -> List[str]:
+    def _identify_missing_fields(self, extracted: ExtractedFields) -> list[str]:
         """
         Identify missing mandatory fields
         
@@ -242,9 +273,9 @@ class FNOLProcessor:
     def _determine_route(
         self,
         extracted: ExtractedFields,
-        missing_fields: List[str],
+        missing_fields: list[str],
         content: str
-    ) -> Tuple[ClaimRoute, str]:
+    ) -> tuple[ClaimRoute, str]:
         """
         Determine claim routing based on rules
         
@@ -327,6 +358,7 @@ def process_all_documents(input_dir: str, output_dir: str) -> None:
         input_dir: Directory containing FNOL documents
         output_dir: Directory to save processed results
     """
+    import json
     import os
 
     processor = FNOLProcessor()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+FNOL Claims Processing Server
+Keeps a warm FNOLProcessor resident behind a Unix domain socket so that
+per-claim invocations (see fnol_client.py) skip imports and regex compilation.
+
+Protocol: the client sends the raw UTF-8 document text and closes its write
+side; the server replies with "OK\\n" followed by the JSON result, or
+"ERROR\\n" followed by a message, then closes the connection.
+"""
+
+import fcntl
+import json
+import os
+import signal
+import socketserver
+import sys
+import time
+
+from fnol_client import (
+    SERVER_UNAVAILABLE, ensure_private_dir, get_peer_uid, get_socket_path, send_document
+)
+from fnol_processor import FNOLProcessor
+
+# Seconds without a request after which the server exits
+DEFAULT_IDLE_TIMEOUT = 900
+
+# Seconds a single client may take to send its document
+REQUEST_TIMEOUT = 5
+
+# Seconds to wait for the lock held by a previous server. A server shutting
+# down may be joining a handler for up to REQUEST_TIMEOUT, so wait longer
+# than that (fnol_client.SERVER_START_TIMEOUT must in turn exceed this)
+LOCK_TIMEOUT = 2 * REQUEST_TIMEOUT
+
+
+class FNOLRequestHandler(socketserver.StreamRequestHandler):
+    """Handles one document per connection"""
+
+    timeout = REQUEST_TIMEOUT
+
+    def handle(self):
+        try:
+            data = self.rfile.read()
+
+            # Only serve processes running as the same user. The document is
+            # read first so the connection closes cleanly and the client
+            # receives this reply instead of mistaking a reset for a missing
+            # server
+            peer_uid = get_peer_uid(self.request)
+            if peer_uid is not None and peer_uid != os.getuid():
+                raise PermissionError(
+                    f"server runs as uid {os.getuid()}, client is uid {peer_uid}"
+                )
+
+            result = self.server.processor.process_bytes(data)
+            response = b'OK\n' + json.dumps(result, indent=2).encode('utf-8')
+        except Exception as exc:
+            response = b'ERROR\n' + f"{type(exc).__name__}: {exc}".encode('utf-8')
+
+        try:
+            self.wfile.write(response)
+        except OSError:
+            # The client stopped waiting; nothing left to do
+            pass
+
+
+class FNOLServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Server handling each connection in its own thread, so a slow client
+    cannot hold up others, and exiting after a period of inactivity
+
+    FNOLProcessor keeps no state between documents, so one instance is
+    shared by all handler threads. Handler threads are joined on close so
+    in-flight requests finish before the server exits.
+    """
+
+    def __init__(self, socket_path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        Initialize and bind the server
+
+        Args:
+            socket_path: Path of the Unix domain socket to listen on
+            idle_timeout: Seconds without a request before serve() returns
+        """
+        self.processor = FNOLProcessor()
+        # Run every extraction pattern once so they are compiled and cached
+        self.processor.process_text('')
+
+        self.timeout = idle_timeout
+        self._idle = False
+        super().__init__(socket_path, FNOLRequestHandler)
+
+    def handle_timeout(self):
+        self._idle = True
+
+    def serve(self) -> None:
+        """Handle requests until no request arrives within the idle timeout"""
+        while not self._idle:
+            self.handle_request()
+
+
+def acquire_lock(lock_fd: int, socket_path: str) -> bool:
+    """
+    Take the server lock, waiting while a previous server shuts down
+
+    Args:
+        lock_fd: Open descriptor of the lock file
+        socket_path: Path of the Unix domain socket to serve on
+
+    Returns:
+        True if the lock was taken, False if another server is answering
+        on socket_path or the lock stayed busy for LOCK_TIMEOUT
+    """
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while True:
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            pass
+
+        try:
+            send_document(b'', socket_path)
+            return False
+        except SERVER_UNAVAILABLE:
+            pass
+
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+
+
+def run_server(socket_path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    """
+    Run a server on socket_path unless another one already owns it
+
+    Args:
+        socket_path: Path of the Unix domain socket to listen on
+        idle_timeout: Seconds without a request before the server exits
+    """
+    ensure_private_dir(os.path.dirname(socket_path))
+
+    # A lock file guarantees a single server per socket when several
+    # clients try to start one at the same time. It is left in place on
+    # exit: removing a flock()ed file lets a waiting server lock a stale inode
+    lock_fd = os.open(socket_path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+    if not acquire_lock(lock_fd, socket_path):
+        os.close(lock_fd)
+        return
+
+    try:
+        # Remove a socket left behind by a server that did not exit cleanly
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+        # Only the owning user may connect
+        old_umask = os.umask(0o077)
+        try:
+            server = FNOLServer(socket_path, idle_timeout)
+        finally:
+            os.umask(old_umask)
+
+        try:
+            server.serve()
+        finally:
+            # Stop listening before removing the socket and releasing the
+            # lock, so clients see the server as gone and start a new one
+            server.server_close()
+            os.unlink(socket_path)
+    finally:
+        os.close(lock_fd)
+
+
+if __name__ == "__main__":
+    socket_path = os.path.abspath(sys.argv[1]) if len(sys.argv) > 1 else get_socket_path()
+    if len(sys.argv) > 2:
+        idle_timeout = float(sys.argv[2])
+    else:
+        idle_timeout = float(os.environ.get('FNOL_IDLE_TIMEOUT', DEFAULT_IDLE_TIMEOUT))
+
+    # Exit through the normal cleanup path so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    run_server(socket_path, idle_timeout)
@@ -0,0 +1,218 @@
+"""
+Tests for the FNOL client and warm server
+Each test uses its own private socket directory and a short idle timeout
+"""
+
+import fcntl
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+sys.path.insert(0, SRC_DIR)
+
+import fnol_client
+from fnol_client import (
+    FNOLServerError, SERVER_UNAVAILABLE, ensure_private_dir, process_claim, send_document
+)
+from fnol_processor import FNOLProcessor
+
+SERVER_SCRIPT = os.path.join(SRC_DIR, 'fnol_server.py')
+DOCUMENTS_DIR = os.path.join(ROOT_DIR, 'fnol_documents')
+DOCUMENTS = sorted(
+    os.path.join(DOCUMENTS_DIR, f) for f in os.listdir(DOCUMENTS_DIR) if f.endswith('.txt')
+)
+
+# Multi-line FNOL document with CRLF line endings, so field-level
+# differences in newline handling show up in the extracted values
+CRLF_DOCUMENT = (
+    "POLICY NUMBER: PA-123456\r\n"
+    "INSURED NAME: Jane Doe\r\n"
+    "DATE OF LOSS: 01/15/2024\r\n"
+    "LOSS LOCATION:\r\n"
+    "STREET: 12 Main St\r\n"
+    "CLAIMANT NAME: Jane Doe\r\n"
+    "ESTIMATED DAMAGE AMOUNT: $4,500.00\r\n"
+    "ACCIDENT DESCRIPTION: Rear-ended at light\r\n"
+    "second line of text\r\n"
+    "CLAIM TYPE: Property Damage\r\n"
+)
+
+
+def wait_until(condition, timeout=10.0):
+    """Poll condition until it returns true or timeout seconds pass"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError("Condition not met in time")
+        time.sleep(0.01)
+
+
+def server_answers(socket_path):
+    """Return True if a server on socket_path completes a request"""
+    try:
+        send_document(b'', socket_path)
+        return True
+    except SERVER_UNAVAILABLE:
+        return False
+
+
+def start_server(socket_path, idle_timeout=10):
+    """Start a server and wait until it answers"""
+    proc = subprocess.Popen([sys.executable, SERVER_SCRIPT, socket_path, str(idle_timeout)])
+    wait_until(lambda: server_answers(socket_path))
+    return proc
+
+
+def read_document(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    socket_dir = tmp_path / 'run'
+    socket_dir.mkdir(mode=0o700)
+    path = str(socket_dir / 'fnol.sock')
+    monkeypatch.setenv('FNOL_SOCKET', path)
+    monkeypatch.setenv('FNOL_IDLE_TIMEOUT', '1')
+    yield path
+    # Servers started by the client exit on their own after the idle timeout
+    wait_until(lambda: not os.path.exists(path))
+
+
+@pytest.fixture
+def crlf_document(tmp_path):
+    path = tmp_path / 'FNOL_CRLF.txt'
+    path.write_bytes(CRLF_DOCUMENT.encode('utf-8'))
+    return str(path)
+
+
+@pytest.fixture
+def server(socket_path):
+    proc = start_server(socket_path)
+    yield proc
+    proc.terminate()
+    proc.wait(timeout=10)
+
+
+@pytest.mark.parametrize('document', DOCUMENTS, ids=os.path.basename)
+def test_round_trip_matches_processor(server, socket_path, document):
+    result = json.loads(send_document(read_document(document), socket_path))
+    assert result == FNOLProcessor().process_document(document)
+
+
+def test_round_trip_matches_processor_for_crlf_document(server, socket_path, crlf_document):
+    result = json.loads(send_document(read_document(crlf_document), socket_path))
+
+    assert result == FNOLProcessor().process_document(crlf_document)
+    assert result['extractedFields']['incident_description'] == (
+        "Rear-ended at light\nsecond line of text"
+    )
+
+
+def test_autostarts_server_when_none_running(socket_path):
+    assert not os.path.exists(socket_path)
+
+    result = json.loads(process_claim(DOCUMENTS[0]))
+
+    assert result == FNOLProcessor().process_document(DOCUMENTS[0])
+    assert os.path.exists(socket_path)
+
+
+def test_error_reply_on_invalid_utf8(server, socket_path):
+    with pytest.raises(FNOLServerError, match='UnicodeDecodeError'):
+        send_document(b'\xff\xfe', socket_path)
+
+
+def test_rejected_client_gets_error_reply(socket_path, monkeypatch):
+    import fnol_server
+
+    # Make the server see every client as another user
+    monkeypatch.setattr(fnol_server, 'get_peer_uid', lambda sock: os.getuid() + 1)
+    server = fnol_server.FNOLServer(socket_path)
+    thread = threading.Thread(target=server.handle_request)
+    thread.start()
+    try:
+        with pytest.raises(FNOLServerError, match='PermissionError'):
+            send_document(b'x' * (1 << 20), socket_path)
+    finally:
+        thread.join()
+        server.server_close()
+        os.unlink(socket_path)
+
+
+@pytest.mark.parametrize('args', [[], ['--local']], ids=['server', 'local'])
+def test_cli_reports_invalid_utf8_the_same_way(socket_path, tmp_path, args):
+    document = tmp_path / 'invalid.txt'
+    document.write_bytes(b'\xff\xfe')
+
+    proc = subprocess.run(
+        [sys.executable, os.path.join(SRC_DIR, 'fnol_client.py'), *args, str(document)],
+        capture_output=True, text=True, timeout=30
+    )
+
+    assert proc.returncode == 1
+    assert proc.stderr.startswith('Error: UnicodeDecodeError: ')
+
+
+def test_only_one_server_per_socket(server, socket_path):
+    second = subprocess.run([sys.executable, SERVER_SCRIPT, socket_path], timeout=10)
+
+    assert second.returncode == 0
+    assert server.poll() is None
+    assert server_answers(socket_path)
+
+
+def test_idle_exit_removes_socket(socket_path):
+    proc = start_server(socket_path, idle_timeout=0.5)
+
+    assert proc.wait(timeout=10) == 0
+    assert not os.path.exists(socket_path)
+
+
+def test_stalled_client_does_not_block_others(server, socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled:
+        stalled.connect(socket_path)
+
+        start = time.monotonic()
+        send_document(read_document(DOCUMENTS[0]), socket_path)
+        assert time.monotonic() - start < 1.0
+
+
+def test_client_waits_while_old_server_holds_lock(socket_path, monkeypatch):
+    started = []
+    start_server = fnol_client.start_server
+    monkeypatch.setattr(
+        fnol_client, 'start_server', lambda path: started.append(path) or start_server(path)
+    )
+
+    # Simulate a server that has removed its socket but not yet released
+    # its lock during idle shutdown
+    lock_fd = os.open(socket_path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+    fcntl.flock(lock_fd, fcntl.LOCK_EX)
+    release = threading.Timer(0.5, os.close, [lock_fd])
+    release.start()
+    try:
+        result = json.loads(process_claim(DOCUMENTS[0]))
+    finally:
+        release.join()
+
+    assert result == FNOLProcessor().process_document(DOCUMENTS[0])
+    assert len(started) == 1
+
+
+def test_rejects_socket_dir_accessible_to_others(tmp_path):
+    shared = tmp_path / 'shared'
+    shared.mkdir()
+    shared.chmod(0o755)
+
+    with pytest.raises(PermissionError):
+        ensure_private_dir(str(shared))